@@ -1,9 +1,19 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, UploadFile, File, Form, Header, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from ..services.resume_parser import ResumeParser
+from ..services.job_registry import JobRegistry
+from ..services.analysis_store import analysis_store
+from ..services.admission import AdmissionRejected, analyze_limiter
+from ..models.schemas import (
+    AnalysisPage, AnalysisRecord, AnalysisStats, AnalyzeResponse, JobDescriptionCreate, JobDescriptionRecord
+)
 from ..config import settings
+from ..utils import runtime
+from ..utils.serialization import MSGPACK, NDJSON, model_response, ndjson_response, negotiate
 from typing import Optional
+import hashlib
 import os
+import time
 
 router = APIRouter()
 
@@ -16,12 +26,23 @@ async def root():
         "version": "1.0.0"
     }
 
-@router.post("/analyze-resume")
+def _server_busy(rejection: AdmissionRejected) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=f"Server busy: {rejection.reason}. Please retry later.",
+        headers={"Retry-After": str(rejection.retry_after)}
+    )
+
+@router.post("/analyze-resume", response_model=AnalyzeResponse)
 async def analyze_resume(
     file: UploadFile = File(...),
     job_title: Optional[str] = Form(None),
     job_description: Optional[str] = Form(None),
-    target_industry: Optional[str] = Form(None)
+    target_industry: Optional[str] = Form(None),
+    job_id: Optional[str] = Form(None),
+    user_id: Optional[str] = Form(None),
+    x_tenant_id: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None)
 ):
     """
     Main endpoint to analyze resume
@@ -31,19 +52,39 @@ async def analyze_resume(
     - job_title: Optional - target job title
     - job_description: Optional - job description to match against
     - target_industry: Optional - target industry
+    - job_id: Optional - registered job (see POST /jobs), used instead of job_description
+    - user_id: Optional - owner of the analysis, for history queries
+    - X-Tenant-ID header: Optional - tenant for concurrency limits (defaults to user_id;
+      requests with neither are only held to the global limit)
     
     Returns:
     - Complete resume analysis with ATS score and suggestions
+    - Under overload: a deterministic-only analysis ("degraded": true),
+      or 429 with Retry-After when ADMISSION_OVERLOAD_MODE is "reject"
+      or the degraded pool (ADMISSION_DEGRADED_LIMIT) is full
+    - JSON by default; MessagePack with Accept: application/msgpack
     """
     
     # Validate file extension
     file_extension = file.filename.split('.')[-1].lower()
-    if file_extension not in settings.ALLOWED_EXTENSIONS:
+    if file_extension not in settings.allowed_extensions_list:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type. Allowed types: {', '.join(settings.ALLOWED_EXTENSIONS)}"
+            detail=f"Invalid file type. Allowed types: {', '.join(settings.allowed_extensions_list)}"
         )
     
+    # Resolve registered job description
+    job_keywords = None
+    if job_id:
+        # May read the SQLite shared cache; keep it off the event loop
+        entry = await run_in_threadpool(JobRegistry.get_with_keywords, job_id)
+        if entry is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job_id: {job_id}")
+        job, job_keywords = entry
+        job_description = job.summary
+        job_title = job_title or job.job_title
+        target_industry = target_industry or job.target_industry
+    
     try:
         # Read file content
         file_content = await file.read()
@@ -55,24 +96,57 @@ async def analyze_resume(
                 detail=f"File too large. Maximum size: {settings.MAX_FILE_SIZE / 1024 / 1024}MB"
             )
         
-        # Parse and analyze
-        analysis = await ResumeParser.parse_and_analyze(
+        # Parse and analyze (admission-controlled)
+        started = time.perf_counter()
+        tenant = x_tenant_id or user_id
+        parse_args = dict(
             file_content=file_content,
             filename=file.filename,
             job_title=job_title,
             job_description=job_description,
-            target_industry=target_industry
+            target_industry=target_industry,
+            job_keywords=job_keywords,
+            owner=tenant
         )
+        degraded = False
+        try:
+            async with analyze_limiter.slot(tenant):
+                analysis = await ResumeParser.parse_and_analyze(**parse_args)
+        except AdmissionRejected as e:
+            if settings.ADMISSION_OVERLOAD_MODE != "degrade":
+                raise _server_busy(e)
+            degraded = True
+            try:
+                async with analyze_limiter.degraded_slot():
+                    analysis = await ResumeParser.parse_and_analyze(**parse_args, use_ai=False)
+            except AdmissionRejected as degraded_rejection:
+                raise _server_busy(degraded_rejection)
+        
+        # Persist in the background (does not add latency); anonymous
+        # analyses could never be listed again, so they are not stored
+        if settings.ANALYSIS_HISTORY_ENABLED and user_id:
+            analysis_store.record(
+                analysis,
+                filename=file.filename,
+                file_hash=hashlib.sha256(file_content).hexdigest(),
+                duration_ms=(time.perf_counter() - started) * 1000,
+                user_id=user_id,
+                job_id=job_id,
+                job_title=job_title,
+            )
         
-        return JSONResponse(
-            status_code=200,
-            content={
-                "success": True,
-                "filename": file.filename,
-                "analysis": analysis.model_dump()
-            }
+        return model_response(
+            AnalyzeResponse(
+                success=True,
+                filename=file.filename,
+                degraded=degraded,
+                analysis=analysis
+            ),
+            accept
         )
         
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -81,6 +155,96 @@ async def analyze_resume(
             detail=f"Error processing resume: {str(e)}"
         )
 
+# Plain def: registration writes to the SQLite shared cache, so FastAPI
+# runs these in the threadpool rather than on the event loop
+@router.post("/jobs", response_model=JobDescriptionRecord)
+def register_job(job: JobDescriptionCreate):
+    """
+    Register a job description once and get a reusable job_id
+    
+    The description is tokenized and summarized at registration, so
+    analyze requests can pass job_id instead of the full text.
+    """
+    try:
+        return JobRegistry.register(job)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/jobs/{job_id}", response_model=JobDescriptionRecord)
+def get_job(job_id: str):
+    """Get a registered job description"""
+    job = JobRegistry.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job_id: {job_id}")
+    return job
+
+def _require_history() -> None:
+    # History exposes resume-derived content; it stays hidden unless enabled
+    if not settings.ANALYSIS_HISTORY_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+def _history_filters(
+    user_id: str,
+    file_hash: Optional[str],
+    job_id: Optional[str],
+    min_score: Optional[int],
+    max_score: Optional[int],
+) -> dict:
+    return {
+        "user_id": user_id,
+        "file_hash": file_hash,
+        "job_id": job_id,
+        "min_score": min_score,
+        "max_score": max_score,
+    }
+
+@router.get("/analyses", response_model=AnalysisPage)
+def list_analyses(
+    user_id: str = Query(..., min_length=1),
+    file_hash: Optional[str] = None,
+    job_id: Optional[str] = None,
+    min_score: Optional[int] = Query(None, ge=0, le=100),
+    max_score: Optional[int] = Query(None, ge=0, le=100),
+    limit: int = Query(20, ge=1, le=200),
+    offset: int = Query(0, ge=0),
+    accept: Optional[str] = Header(None)
+):
+    """
+    List a user's past analyses, newest first, filtered by file, job or score range
+    
+    Accept: application/x-ndjson returns the page as one record per line, with the
+    total in the X-Total-Count header.
+    """
+    _require_history()
+    filters = _history_filters(user_id, file_hash, job_id, min_score, max_score)
+    page = analysis_store.query(filters, limit=limit, offset=offset)
+    if negotiate(accept, (NDJSON, MSGPACK)) == NDJSON:
+        return ndjson_response(page.items, headers={"X-Total-Count": str(page.total)})
+    return model_response(page, accept)
+
+@router.get("/analyses/stats", response_model=AnalysisStats)
+def analyses_stats(
+    user_id: str = Query(..., min_length=1),
+    file_hash: Optional[str] = None,
+    job_id: Optional[str] = None,
+    min_score: Optional[int] = Query(None, ge=0, le=100),
+    max_score: Optional[int] = Query(None, ge=0, le=100),
+    accept: Optional[str] = Header(None)
+):
+    """Aggregate scores and timings over a user's past analyses"""
+    _require_history()
+    filters = _history_filters(user_id, file_hash, job_id, min_score, max_score)
+    return model_response(analysis_store.stats(filters), accept)
+
+@router.get("/analyses/{analysis_id}", response_model=AnalysisRecord)
+def get_analysis(analysis_id: str, accept: Optional[str] = Header(None)):
+    """Get a past analysis including the full result"""
+    _require_history()
+    record = analysis_store.get(analysis_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"Analysis not found: {analysis_id}")
+    return model_response(record, accept)
+
 @router.get("/health")
 async def health_check():
     """Check if API and OpenAI are working"""
@@ -106,3 +270,12 @@ async def health_check():
             "status": "unhealthy",
             "error": str(e)
         }
+
+@router.get("/health/runtime")
+async def runtime_health():
+    """Cold start, uptime, memory and admission state of the worker that served this request"""
+    return {
+        **runtime.report(),
+        "admission": analyze_limiter.snapshot(),
+        "analysis_store": analysis_store.health(),
+    }
@@ -21,6 +21,11 @@ class ImprovementSuggestion(BaseModel):
     suggestion: str
     example: Optional[str] = None
 
+class NearDuplicate(BaseModel):
+    fingerprint: str  # SimHash of the closest earlier upload (hex)
+    distance: int  # Differing bits out of 64; 0 = same text
+    ai_analysis_reused: bool
+
 class ResumeAnalysis(BaseModel):
     ats_score: ATSScore
     sections_analysis: List[ResumeSection]
@@ -28,8 +33,57 @@ class ResumeAnalysis(BaseModel):
     strengths: List[str]
     missing_elements: List[str]
     overall_feedback: str
+    fingerprint: Optional[str] = None  # SimHash of the extracted text (hex)
+    near_duplicate: Optional[NearDuplicate] = None
+
+class AnalyzeResponse(BaseModel):
+    success: bool
+    filename: str
+    degraded: bool  # True when AI review was skipped under load
+    analysis: ResumeAnalysis
 
 class AnalyzeRequest(BaseModel):
     job_title: Optional[str] = None
     job_description: Optional[str] = None
-    target_industry: Optional[str] = None
\ No newline at end of file
+    target_industry: Optional[str] = None
+
+class JobDescriptionCreate(BaseModel):
+    job_description: str
+    job_title: Optional[str] = None
+    target_industry: Optional[str] = None
+
+class JobDescriptionRecord(BaseModel):
+    job_id: str
+    job_title: Optional[str] = None
+    target_industry: Optional[str] = None
+    keywords: List[str]
+    summary: str  # Compact, normalized text used in AI prompts
+    summary_truncated: bool = False  # Lines were dropped to fit JOB_SUMMARY_MAX_CHARS
+
+class AnalysisRecord(BaseModel):
+    id: str  # Random, unguessable public id
+    created_at: float  # Unix timestamp
+    user_id: Optional[str] = None
+    filename: str
+    file_hash: str
+    job_id: Optional[str] = None
+    job_title: Optional[str] = None
+    overall_score: int
+    keyword_score: int
+    formatting_score: int
+    content_score: int
+    duration_ms: float
+    analysis: Optional[ResumeAnalysis] = None  # Only included for single-record lookups
+
+class AnalysisPage(BaseModel):
+    items: List[AnalysisRecord]
+    total: int
+    limit: int
+    offset: int
+
+class AnalysisStats(BaseModel):
+    count: int
+    avg_overall_score: Optional[float] = None
+    min_overall_score: Optional[int] = None
+    max_overall_score: Optional[int] = None
+    avg_duration_ms: Optional[float] = None
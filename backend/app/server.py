@@ -0,0 +1,105 @@
+"""
+Production launcher.
+
+Runs the API with several worker processes. Heavy modules (PDF/DOCX
+parsers, the OpenAI SDK, scoring tables) are imported once in the master
+before forking, so workers start fast and share those pages copy-on-write.
+Caches that must be consistent across workers live in SharedCache (SQLite).
+
+Usage:
+    python main.py --production [--workers N]
+"""
+from __future__ import annotations
+
+import gc
+import importlib
+import logging
+import multiprocessing
+from typing import Dict, Optional
+
+from .config import settings
+from .services.shared_cache import SharedCache
+from .utils import runtime
+
+logger = logging.getLogger("uvicorn.error")
+
+# Imported in the master before forking; "main" pulls in routes and services
+PRELOAD_MODULES = runtime.HEAVY_MODULES + ("main",)
+
+
+def preload() -> Dict[str, float]:
+    """Import heavy modules and return per-module import time in ms."""
+    timings = runtime.import_timed(PRELOAD_MODULES)
+    runtime.record_preload(timings)
+    return timings
+
+
+def default_workers() -> int:
+    return settings.WEB_CONCURRENCY or multiprocessing.cpu_count() * 2 + 1
+
+
+def _post_fork(server, worker) -> None:
+    runtime.mark_process_start()
+    # SQLite connections must not be shared across processes
+    SharedCache.reset_connections()
+
+
+def _when_ready(server) -> None:
+    memory = runtime.memory_mb()
+    server.log.info(
+        "Master ready: preload %s ms, memory RSS %s MB, PSS %s MB, USS %s MB",
+        runtime.report()["preload_ms"],
+        memory["rss"], memory["pss"], memory["uss"],
+    )
+
+
+def run_production(workers: Optional[int] = None, host: Optional[str] = None, port: Optional[int] = None) -> None:
+    """Start a multi-worker server with preloading and graceful drain."""
+    workers = workers or default_workers()
+    host = host or settings.HOST
+    port = port or settings.PORT
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        BaseApplication = None
+
+    if BaseApplication is None:
+        # Fallback: uvicorn spawns (not forks) workers, so each worker
+        # imports the app itself and nothing is shared copy-on-write.
+        import uvicorn
+
+        logger.warning("gunicorn not installed; starting uvicorn workers without preloading")
+        uvicorn.run(
+            "main:app",
+            host=host,
+            port=port,
+            workers=workers,
+            timeout_graceful_shutdown=settings.GRACEFUL_TIMEOUT,
+        )
+        return
+
+    preload()
+    app = importlib.import_module("main").app
+    # Move preloaded objects out of GC tracking so collections in the
+    # workers don't touch (and un-share) their memory pages
+    gc.freeze()
+
+    class ProductionApplication(BaseApplication):
+        def load_config(self):
+            options = {
+                "bind": f"{host}:{port}",
+                "workers": workers,
+                "worker_class": "uvicorn.workers.UvicornWorker",
+                "preload_app": True,
+                "graceful_timeout": settings.GRACEFUL_TIMEOUT,
+                "post_fork": _post_fork,
+                "when_ready": _when_ready,
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    ProductionApplication().run()
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from ..config import settings
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request cannot get a slot; carries a Retry-After hint."""
+
+    def __init__(self, reason: str, retry_after: int) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdaptiveLimiter:
+    """
+    Global and per-tenant in-flight limits with an AIMD-adjusted global limit.
+
+    Notes:
+    - Each completed request reports how long it held its slot. Completions
+      under the target latency grow the limit by 1/limit (about +1 per
+      full window), but only while the limit was actually the bottleneck
+      (all slots busy or requests waiting); otherwise light traffic would
+      ratchet it up to max_limit and the next burst would be admitted in
+      full. Slow completions multiply it by BACKOFF, at most once per
+      observed latency, so one burst doesn't collapse it to the floor.
+    - Requests that cannot be admitted wait up to `queue_timeout` seconds,
+      with at most `max_queue` waiters, then get AdmissionRejected.
+    - Requests without a tenant (None) are held to the global limit only,
+      rather than sharing one tenant bucket.
+    - The degraded fallback (analysis without AI) has its own fixed pool of
+      `degraded_limit` slots and never waits: when it is full the request
+      is rejected.
+    - Per event loop (i.e. per worker process); limits are per worker.
+    """
+
+    BACKOFF = 0.9
+    # Weight of the newest sample in the latency moving average
+    EWMA_ALPHA = 0.2
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        tenant_limit: int,
+        target_latency_ms: float,
+        queue_timeout: float,
+        max_queue: int,
+        degraded_limit: int,
+    ) -> None:
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.tenant_limit = tenant_limit
+        self.target_latency_ms = target_latency_ms
+        self.queue_timeout = queue_timeout
+        self.max_queue = max_queue
+        self.degraded_limit = degraded_limit
+
+        self.in_flight = 0
+        self.waiting = 0
+        self.degraded_in_flight = 0
+        self.rejected = 0
+        self.latency_ewma_ms: Optional[float] = None
+        self._tenant_in_flight: Dict[str, int] = {}
+        self._last_decrease = 0.0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_settings(cls) -> "AdaptiveLimiter":
+        return cls(
+            initial_limit=settings.ADMISSION_INITIAL_LIMIT,
+            min_limit=settings.ADMISSION_MIN_LIMIT,
+            max_limit=settings.ADMISSION_MAX_LIMIT,
+            tenant_limit=settings.ADMISSION_TENANT_LIMIT,
+            target_latency_ms=settings.ADMISSION_TARGET_LATENCY_MS,
+            queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT,
+            max_queue=settings.ADMISSION_MAX_QUEUE,
+            degraded_limit=settings.ADMISSION_DEGRADED_LIMIT,
+        )
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        # Created lazily so it belongs to the running loop, not the importing one
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+    def _can_admit(self, tenant: Optional[str]) -> bool:
+        if self.in_flight >= int(self.limit):
+            return False
+        return tenant is None or self._tenant_in_flight.get(tenant, 0) < self.tenant_limit
+
+    def retry_after(self) -> int:
+        """Seconds until a slot is likely to free up."""
+        latency_ms = self.latency_ewma_ms or self.target_latency_ms
+        return max(1, math.ceil(latency_ms / 1000))
+
+    def _reject(self, reason: str) -> AdmissionRejected:
+        self.rejected += 1
+        return AdmissionRejected(reason, self.retry_after())
+
+    async def acquire(self, tenant: Optional[str]) -> None:
+        async with self.condition:
+            if not self._can_admit(tenant):
+                if self.waiting >= self.max_queue:
+                    raise self._reject("Too many requests waiting")
+                self.waiting += 1
+                try:
+                    await asyncio.wait_for(
+                        self.condition.wait_for(lambda: self._can_admit(tenant)),
+                        self.queue_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    raise self._reject("Timed out waiting for capacity")
+                finally:
+                    self.waiting -= 1
+            self.in_flight += 1
+            if tenant is not None:
+                self._tenant_in_flight[tenant] = self._tenant_in_flight.get(tenant, 0) + 1
+
+    async def release(self, tenant: Optional[str], latency_ms: float) -> None:
+        async with self.condition:
+            saturated = self.in_flight >= int(self.limit) or self.waiting > 0
+            self.in_flight -= 1
+            if tenant is not None:
+                remaining = self._tenant_in_flight.get(tenant, 1) - 1
+                if remaining > 0:
+                    self._tenant_in_flight[tenant] = remaining
+                else:
+                    self._tenant_in_flight.pop(tenant, None)
+            self._observe(latency_ms, saturated)
+            # Waiters have tenant-specific predicates, so wake them all
+            self.condition.notify_all()
+
+    def _observe(self, latency_ms: float, saturated: bool) -> None:
+        """AIMD update from one completed request."""
+        if self.latency_ewma_ms is None:
+            self.latency_ewma_ms = latency_ms
+        else:
+            self.latency_ewma_ms += self.EWMA_ALPHA * (latency_ms - self.latency_ewma_ms)
+
+        if latency_ms <= self.target_latency_ms:
+            if saturated:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            return
+
+        now = time.monotonic()
+        if (now - self._last_decrease) * 1000 >= self.latency_ewma_ms:
+            self.limit = max(self.min_limit, self.limit * self.BACKOFF)
+            self._last_decrease = now
+
+    @asynccontextmanager
+    async def slot(self, tenant: Optional[str]) -> AsyncIterator[None]:
+        """Hold an in-flight slot for the duration of the block."""
+        await self.acquire(tenant)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            await self.release(tenant, (time.perf_counter() - started) * 1000)
+
+    @asynccontextmanager
+    async def degraded_slot(self) -> AsyncIterator[None]:
+        """Hold a slot from the fixed degraded pool, or reject at once."""
+        # No await between check and increment, so no lock is needed
+        if self.degraded_in_flight >= self.degraded_limit:
+            raise self._reject("Degraded capacity exhausted")
+        self.degraded_in_flight += 1
+        try:
+            yield
+        finally:
+            self.degraded_in_flight -= 1
+
+    def snapshot(self) -> Dict:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "degraded_in_flight": self.degraded_in_flight,
+            "degraded_limit": self.degraded_limit,
+            "rejected": self.rejected,
+            "latency_ewma_ms": round(self.latency_ewma_ms, 1) if self.latency_ewma_ms is not None else None,
+            "target_latency_ms": self.target_latency_ms,
+        }
+
+
+# Guards ResumeParser.parse_and_analyze in /api/analyze-resume
+analyze_limiter = AdaptiveLimiter.from_settings()
@@ -21,6 +21,12 @@ class AIAnalyzer:
         - OPENAI_MODEL
     """
 
+    # Canned results returned when the model call or its JSON fails
+    INVALID_JSON_ISSUE = "AI response was not valid JSON"
+    SECTIONS_UNAVAILABLE = "Detailed section analysis unavailable"
+    NO_KEYWORDS = "No keywords returned"
+    KEYWORDS_UNAVAILABLE = "Unable to generate keyword suggestions"
+
     def __init__(self) -> None:
         # Create client once per instance (better than module-global in many cases)
         self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
@@ -127,7 +133,7 @@ Focus on:
                     {
                         "category": "General",
                         "priority": "Medium",
-                        "issue": "AI response was not valid JSON",
+                        "issue": AIAnalyzer.INVALID_JSON_ISSUE,
                         "suggestion": "Try again (shorter resume text) or check model settings",
                         "example": None,
                     }
@@ -175,7 +181,7 @@ Return ONLY a JSON array in this format:
                 {
                     "section_name": "General",
                     "content": "Resume content detected",
-                    "issues": ["Detailed section analysis unavailable"],
+                    "issues": [AIAnalyzer.SECTIONS_UNAVAILABLE],
                     "suggestions": ["Ensure clear section headers", "Use consistent formatting"],
                 }
             ]
@@ -219,7 +225,23 @@ Return ONLY a JSON array of strings like:
             for item in result:
                 if isinstance(item, str):
                     keywords.append(item.strip())
-            return keywords if keywords else ["No keywords returned"]
+            return keywords if keywords else [AIAnalyzer.NO_KEYWORDS]
 
         except Exception:
-            return ["Unable to generate keyword suggestions"]
+            return [AIAnalyzer.KEYWORDS_UNAVAILABLE]
+
+    @staticmethod
+    def is_fallback(
+        analysis: Dict,
+        sections: List[Dict],
+        keywords: Optional[List[str]] = None,
+    ) -> bool:
+        """True if any part of a result is a canned fallback, not model output."""
+        if any(
+            suggestion.get("issue") == AIAnalyzer.INVALID_JSON_ISSUE
+            for suggestion in analysis.get("improvement_suggestions", [])
+        ):
+            return True
+        if any(AIAnalyzer.SECTIONS_UNAVAILABLE in section.get("issues", []) for section in sections):
+            return True
+        return keywords in ([AIAnalyzer.NO_KEYWORDS], [AIAnalyzer.KEYWORDS_UNAVAILABLE])
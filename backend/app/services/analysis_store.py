@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import queue
+import secrets
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models.schemas import AnalysisPage, AnalysisRecord, AnalysisStats, ResumeAnalysis
+from ..config import settings
+
+
+class AnalysisRepository(ABC):
+    """Storage interface for analysis history."""
+
+    @abstractmethod
+    def add_many(self, rows: List[Dict[str, Any]]) -> None:
+        ...
+
+    @abstractmethod
+    def get(self, analysis_id: str) -> Optional[AnalysisRecord]:
+        ...
+
+    @abstractmethod
+    def query(self, filters: Dict[str, Any], limit: int, offset: int) -> AnalysisPage:
+        ...
+
+    @abstractmethod
+    def stats(self, filters: Dict[str, Any]) -> AnalysisStats:
+        ...
+
+    @abstractmethod
+    def prune(self, before: float) -> int:
+        """Delete analyses created before `before` (Unix time); return how many."""
+        ...
+
+
+class SQLiteAnalysisRepository(AnalysisRepository):
+    """
+    SQLite-backed analysis history.
+
+    Notes:
+    - WAL mode lets readers run while the background writer commits.
+    - Each call opens its own connection, so it is safe from any thread.
+    - Every query filters on user_id, so the indexes lead with it.
+    """
+
+    SUMMARY_COLUMNS = (
+        "public_id AS id, created_at, user_id, filename, file_hash, job_id, job_title, "
+        "overall_score, keyword_score, formatting_score, content_score, duration_ms"
+    )
+
+    SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    public_id TEXT NOT NULL UNIQUE,
+    created_at REAL NOT NULL,
+    user_id TEXT,
+    filename TEXT NOT NULL,
+    file_hash TEXT NOT NULL,
+    job_id TEXT,
+    job_title TEXT,
+    overall_score INTEGER NOT NULL,
+    keyword_score INTEGER NOT NULL,
+    formatting_score INTEGER NOT NULL,
+    content_score INTEGER NOT NULL,
+    duration_ms REAL NOT NULL,
+    analysis_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_analyses_user ON analyses (user_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_analyses_user_file ON analyses (user_id, file_hash);
+CREATE INDEX IF NOT EXISTS idx_analyses_user_job ON analyses (user_id, job_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_analyses_user_score ON analyses (user_id, overall_score);
+CREATE INDEX IF NOT EXISTS idx_analyses_created ON analyses (created_at);
+-- Superseded single-column indexes from earlier versions
+DROP INDEX IF EXISTS idx_analyses_file_hash;
+DROP INDEX IF EXISTS idx_analyses_job;
+DROP INDEX IF EXISTS idx_analyses_score;
+"""
+
+    def __init__(self, db_path: str) -> None:
+        self.db_path = db_path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _where(filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause from the supported filters."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column in ("user_id", "file_hash", "job_id"):
+            if filters.get(column) is not None:
+                clauses.append(f"{column} = ?")
+                params.append(filters[column])
+        if filters.get("min_score") is not None:
+            clauses.append("overall_score >= ?")
+            params.append(filters["min_score"])
+        if filters.get("max_score") is not None:
+            clauses.append("overall_score <= ?")
+            params.append(filters["max_score"])
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def add_many(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    """
+INSERT INTO analyses (
+    public_id, created_at, user_id, filename, file_hash, job_id, job_title,
+    overall_score, keyword_score, formatting_score, content_score,
+    duration_ms, analysis_json
+) VALUES (
+    :public_id, :created_at, :user_id, :filename, :file_hash, :job_id, :job_title,
+    :overall_score, :keyword_score, :formatting_score, :content_score,
+    :duration_ms, :analysis_json
+)
+""",
+                    rows,
+                )
+        finally:
+            conn.close()
+
+    def get(self, analysis_id: str) -> Optional[AnalysisRecord]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                f"SELECT {self.SUMMARY_COLUMNS}, analysis_json FROM analyses WHERE public_id = ?",
+                (analysis_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        data = dict(row)
+        analysis = ResumeAnalysis.model_validate_json(data.pop("analysis_json"))
+        return AnalysisRecord(**data, analysis=analysis)
+
+    def query(self, filters: Dict[str, Any], limit: int, offset: int) -> AnalysisPage:
+        where, params = self._where(filters)
+        conn = self._connect()
+        try:
+            total = conn.execute(f"SELECT COUNT(*) FROM analyses{where}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT {self.SUMMARY_COLUMNS} FROM analyses{where} "
+                "ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+                params + [limit, offset],
+            ).fetchall()
+        finally:
+            conn.close()
+        return AnalysisPage(
+            items=[AnalysisRecord(**dict(row)) for row in rows],
+            total=total,
+            limit=limit,
+            offset=offset,
+        )
+
+    def stats(self, filters: Dict[str, Any]) -> AnalysisStats:
+        where, params = self._where(filters)
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT COUNT(*) AS count, AVG(overall_score) AS avg_overall_score, "
+                "MIN(overall_score) AS min_overall_score, MAX(overall_score) AS max_overall_score, "
+                f"AVG(duration_ms) AS avg_duration_ms FROM analyses{where}",
+                params,
+            ).fetchone()
+        finally:
+            conn.close()
+        return AnalysisStats(**dict(row))
+
+    def prune(self, before: float) -> int:
+        conn = self._connect()
+        try:
+            with conn:
+                return conn.execute("DELETE FROM analyses WHERE created_at < ?", (before,)).rowcount
+        finally:
+            conn.close()
+
+
+class AnalysisStore:
+    """
+    Records analyses without blocking the request.
+
+    `record()` only enqueues; a background thread collects rows for up to
+    ANALYSIS_FLUSH_INTERVAL seconds (or ANALYSIS_WRITE_BATCH_SIZE rows) and
+    writes each batch in one transaction. If the queue is full the analysis
+    is dropped rather than slowing requests; `dropped` counts those. The
+    writer also deletes rows older than ANALYSIS_RETENTION_DAYS, at most
+    once per PRUNE_INTERVAL seconds.
+    """
+
+    PRUNE_INTERVAL = 60.0
+
+    def __init__(self, repository: Optional[AnalysisRepository] = None) -> None:
+        self._repository = repository
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=settings.ANALYSIS_QUEUE_MAX_SIZE)
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._dropped = 0
+        self._dropped_lock = threading.Lock()
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def _count_dropped(self, n: int) -> None:
+        # record() runs on request threads and _run() on the writer thread
+        with self._dropped_lock:
+            self._dropped += n
+
+    @property
+    def repository(self) -> AnalysisRepository:
+        # Created on first use so importing the module never touches the disk
+        if self._repository is None:
+            with self._lock:
+                if self._repository is None:
+                    self._repository = SQLiteAnalysisRepository(settings.ANALYSIS_DB_PATH)
+        return self._repository
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or not self._writer.is_alive():
+            with self._lock:
+                if self._writer is None or not self._writer.is_alive():
+                    self._writer = threading.Thread(target=self._run, name="analysis-writer", daemon=True)
+                    self._writer.start()
+
+    def record(
+        self,
+        analysis: ResumeAnalysis,
+        *,
+        filename: str,
+        file_hash: str,
+        duration_ms: float,
+        user_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        job_title: Optional[str] = None,
+    ) -> None:
+        """Queue an analysis for persistence."""
+        row = {
+            "public_id": secrets.token_urlsafe(16),
+            "created_at": time.time(),
+            "user_id": user_id,
+            "filename": filename,
+            "file_hash": file_hash,
+            "job_id": job_id,
+            "job_title": job_title,
+            "overall_score": analysis.ats_score.overall_score,
+            "keyword_score": analysis.ats_score.keyword_score,
+            "formatting_score": analysis.ats_score.formatting_score,
+            "content_score": analysis.ats_score.content_score,
+            "duration_ms": duration_ms,
+            "analysis_json": analysis.model_dump_json(),
+        }
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._count_dropped(1)
+
+    def _run(self) -> None:
+        repository = self.repository
+        stopping = False
+        last_prune = 0.0
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=settings.ANALYSIS_FLUSH_INTERVAL)
+            except queue.Empty:
+                continue
+
+            # Hold the first row up to the flush interval so light traffic
+            # still shares transactions; a full batch or shutdown writes at once
+            batch: List[Dict[str, Any]] = []
+            deadline = time.monotonic() + settings.ANALYSIS_FLUSH_INTERVAL
+            while True:
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= settings.ANALYSIS_WRITE_BATCH_SIZE or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            try:
+                repository.add_many(batch)
+            except Exception:
+                # History is best-effort; never take down the writer thread
+                self._count_dropped(len(batch))
+
+            if time.monotonic() - last_prune >= self.PRUNE_INTERVAL:
+                last_prune = time.monotonic()
+                try:
+                    repository.prune(time.time() - settings.ANALYSIS_RETENTION_DAYS * 86400)
+                except Exception:
+                    pass
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Flush pending writes and stop the writer thread."""
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return
+        self._queue.put(None)
+        writer.join(timeout)
+
+    def get(self, analysis_id: str) -> Optional[AnalysisRecord]:
+        return self.repository.get(analysis_id)
+
+    def health(self) -> Dict[str, int]:
+        return {"queued": self._queue.qsize(), "dropped": self.dropped}
+
+    def query(self, filters: Dict[str, Any], limit: int = 20, offset: int = 0) -> AnalysisPage:
+        return self.repository.query(filters, limit, offset)
+
+    def stats(self, filters: Dict[str, Any]) -> AnalysisStats:
+        return self.repository.stats(filters)
+
+
+analysis_store = AnalysisStore()
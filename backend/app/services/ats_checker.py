@@ -1,5 +1,5 @@
 import re
-from typing import List, Dict
+from typing import List, Dict, FrozenSet, Optional
 
 class ATSChecker:
     # Common ATS-friendly section headers
@@ -17,13 +17,22 @@ class ATSChecker:
         "optimized", "streamlined", "coordinated", "executed"
     ]
     
+    # Words ignored when matching job description keywords
+    COMMON_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'})
+    
+    @staticmethod
+    def extract_job_keywords(job_description: str) -> FrozenSet[str]:
+        """Tokenize a job description into the keyword set used for matching"""
+        return frozenset(re.findall(r'\b\w+\b', job_description.lower())) - ATSChecker.COMMON_WORDS
+    
     @staticmethod
     def calculate_ats_score(resume_text: str, formatting_issues: List[str], 
-                           job_description: str = None) -> Dict:
+                           job_description: str = None,
+                           job_keywords: Optional[FrozenSet[str]] = None) -> Dict:
         """Calculate comprehensive ATS score"""
         
         # Keyword Score (40%)
-        keyword_score = ATSChecker._calculate_keyword_score(resume_text, job_description)
+        keyword_score = ATSChecker._calculate_keyword_score(resume_text, job_description, job_keywords)
         
         # Formatting Score (30%)
         formatting_score = ATSChecker._calculate_formatting_score(resume_text, formatting_issues)
@@ -47,7 +56,8 @@ class ATSChecker:
         }
     
     @staticmethod
-    def _calculate_keyword_score(resume_text: str, job_description: str = None) -> int:
+    def _calculate_keyword_score(resume_text: str, job_description: str = None,
+                                 job_keywords: Optional[FrozenSet[str]] = None) -> int:
         """Calculate keyword optimization score"""
         score = 50  # Base score
         
@@ -61,18 +71,15 @@ class ATSChecker:
         numbers = re.findall(r'\d+%|\$\d+|[\d,]+\+', resume_text)
         score += min(len(numbers) * 3, 15)
         
-        # If job description provided, check keyword match
-        if job_description:
-            job_keywords = set(re.findall(r'\b\w+\b', job_description.lower()))
+        # Registered jobs pass their pre-tokenized keywords; raw text is tokenized here
+        if job_keywords is None and job_description:
+            job_keywords = ATSChecker.extract_job_keywords(job_description)
+        
+        # If job keywords available, check keyword match
+        if job_keywords:
             resume_keywords = set(re.findall(r'\b\w+\b', resume_lower))
-            
-            # Remove common words
-            common_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for'}
-            job_keywords -= common_words
-            
-            if job_keywords:
-                match_ratio = len(job_keywords & resume_keywords) / len(job_keywords)
-                score += int(match_ratio * 15)
+            match_ratio = len(job_keywords & resume_keywords) / len(job_keywords)
+            score += int(match_ratio * 15)
         
         return min(score, 100)
     
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from ..utils.fingerprint import TextFingerprint
+from ..config import settings
+
+
+class DuplicateIndex:
+    """
+    LSH index over SimHash fingerprints of extracted resume text.
+
+    Notes:
+    - The 64-bit fingerprint is split into BANDS bands. Two fingerprints
+      within BANDS - 1 bits of each other share at least one band exactly
+      (pigeonhole), so candidate lookup only checks the matching buckets.
+    - Every upload is indexed, so near-duplicates are flagged even when AI
+      review was skipped or failed. Entries keep the owner, the job context,
+      the normalized-text hash and, only for real model output, the AI
+      results, so `reusable()` can hand them back for a trivially identical
+      resume (same words) from the same owner and job.
+    - In-process and bounded (least recently added entries are evicted).
+    """
+
+    BANDS = 8
+    BAND_BITS = TextFingerprint.BITS // BANDS
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, int], Set[int]] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def job_key(job_title: Optional[str], job_description: Optional[str]) -> str:
+        """Identify the job context an AI result was produced for."""
+        raw = f"{job_title or ''}\x1f{job_description or ''}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def _bands(cls, fingerprint: int) -> List[Tuple[int, int]]:
+        mask = (1 << cls.BAND_BITS) - 1
+        return [(band, (fingerprint >> (band * cls.BAND_BITS)) & mask) for band in range(cls.BANDS)]
+
+    def add(
+        self,
+        fingerprint: int,
+        text_hash: str,
+        owner: Optional[str],
+        job_key: str,
+        ai_result: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        with self._lock:
+            entry_id = next(self._ids)
+            self._entries[entry_id] = {
+                "fingerprint": fingerprint,
+                "text_hash": text_hash,
+                "owner": owner,
+                "job_key": job_key,
+                "ai_result": ai_result,
+            }
+            for band in self._bands(fingerprint):
+                self._buckets.setdefault(band, set()).add(entry_id)
+
+            while len(self._entries) > self.max_entries:
+                old_id, old = self._entries.popitem(last=False)
+                for band in self._bands(old["fingerprint"]):
+                    bucket = self._buckets.get(band)
+                    if bucket is not None:
+                        bucket.discard(old_id)
+                        if not bucket:
+                            del self._buckets[band]
+
+    def nearest(
+        self,
+        fingerprint: int,
+        max_distance: int,
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    ) -> Optional[Tuple[Dict[str, Any], int]]:
+        """Closest entry within `max_distance` bits (and matching `predicate`)."""
+        best: Optional[Tuple[Dict[str, Any], int]] = None
+        with self._lock:
+            candidates: Set[int] = set()
+            for band in self._bands(fingerprint):
+                candidates |= self._buckets.get(band, set())
+            for entry_id in candidates:
+                entry = self._entries[entry_id]
+                distance = TextFingerprint.hamming_distance(fingerprint, entry["fingerprint"])
+                if distance > max_distance or (predicate and not predicate(entry)):
+                    continue
+                if best is None or distance < best[1]:
+                    best = (entry, distance)
+        return best
+
+    def reusable(
+        self, fingerprint: int, text_hash: str, owner: Optional[str], job_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        AI results of the same normalized text, owner and job, if indexed
+
+        SimHash distance alone is not enough to reuse another analysis: a few
+        bits can hide real edits. Identical text has an identical fingerprint,
+        so only distance 0 is looked up. Anonymous requests never reuse.
+        """
+        if owner is None:
+            return None
+        match = self.nearest(
+            fingerprint,
+            0,
+            predicate=lambda entry: (
+                entry["ai_result"] is not None
+                and entry["text_hash"] == text_hash
+                and entry["owner"] == owner
+                and entry["job_key"] == job_key
+            ),
+        )
+        return match[0]["ai_result"] if match else None
+
+
+duplicate_index = DuplicateIndex(settings.DUPLICATE_INDEX_MAX_ENTRIES)
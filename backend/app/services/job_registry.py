@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import FrozenSet, Optional, Tuple
+
+from .ats_checker import ATSChecker
+from .shared_cache import SharedCache
+from ..models.schemas import JobDescriptionCreate, JobDescriptionRecord
+from ..config import settings
+
+
+class JobRegistry:
+    """
+    In-process registry of pre-tokenized job descriptions.
+
+    Notes:
+    - A job description is tokenized and summarized once at registration;
+      analyze requests then reference it by `job_id` instead of resending the text.
+    - Keyword scoring always uses the full description. The summary sent to
+      the AI is the full text when it fits JOB_SUMMARY_MAX_CHARS; otherwise
+      requirement lines are kept first and `summary_truncated` is set.
+    - `job_id` is derived from the normalized text, so registering the same
+      description twice returns the same id.
+    - Least recently used entries are evicted past JOB_REGISTRY_MAX_ENTRIES.
+    - Records are also written to the SharedCache so that other worker
+      processes can resolve a `job_id` registered elsewhere; the shared
+      copy is capped at JOB_REGISTRY_MAX_ENTRIES as well.
+    """
+
+    _entries: "OrderedDict[str, Tuple[JobDescriptionRecord, FrozenSet[str]]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    # Bullets, numbered items and lines that state a requirement
+    REQUIREMENT_LINE = re.compile(
+        r"^(?:[-*\u2022\u00b7]|\d+[.)])\s"
+        r"|\b(?:require[ds]?|requirements?|must|qualifications?|experience|proficien\w*"
+        r"|knowledge|skills?|degree|certifi\w*|years?)\b",
+        re.IGNORECASE,
+    )
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Collapse whitespace and drop repeated lines (boilerplate, copy-paste)."""
+        seen = set()
+        lines = []
+        for line in text.splitlines():
+            line = re.sub(r"\s+", " ", line).strip()
+            if line and line.lower() not in seen:
+                seen.add(line.lower())
+                lines.append(line)
+        return "\n".join(lines)
+
+    @classmethod
+    def _summarize(cls, normalized: str) -> Tuple[str, bool]:
+        """
+        Fit a normalized description into JOB_SUMMARY_MAX_CHARS for AI prompts
+
+        Requirement lines are picked before other lines, then the kept lines
+        are joined in their original order. Returns (summary, truncated).
+        """
+        budget = settings.JOB_SUMMARY_MAX_CHARS
+        if len(normalized) <= budget:
+            return normalized, False
+
+        lines = normalized.split("\n")
+        by_priority = sorted(
+            range(len(lines)), key=lambda i: (cls.REQUIREMENT_LINE.search(lines[i]) is None, i)
+        )
+        kept = set()
+        used = 0
+        for i in by_priority:
+            cost = len(lines[i]) + (1 if kept else 0)
+            if used + cost <= budget:
+                kept.add(i)
+                used += cost
+        if not kept:
+            # A single line longer than the budget
+            return normalized[:budget], True
+        return "\n".join(lines[i] for i in sorted(kept)), True
+
+    @staticmethod
+    def _make_job_id(normalized: str, job_title: Optional[str], target_industry: Optional[str]) -> str:
+        key = "\x1f".join([normalized, job_title or "", target_industry or ""])
+        return "jd_" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+
+    @classmethod
+    def register(cls, job: JobDescriptionCreate) -> JobDescriptionRecord:
+        """Tokenize and summarize a job description once; return its record."""
+        normalized = cls._normalize(job.job_description)
+        if not normalized:
+            raise ValueError("Job description is empty.")
+
+        job_id = cls._make_job_id(normalized, job.job_title, job.target_industry)
+        with cls._lock:
+            existing = cls._entries.get(job_id)
+            if existing is not None:
+                cls._entries.move_to_end(job_id)
+        if existing is not None:
+            # Refresh the shared copy so other workers' trims keep it
+            cls._share(existing[0])
+            return existing[0]
+
+        keywords = ATSChecker.extract_job_keywords(normalized)
+        summary, truncated = cls._summarize(normalized)
+        record = JobDescriptionRecord(
+            job_id=job_id,
+            job_title=job.job_title,
+            target_industry=job.target_industry,
+            keywords=sorted(keywords),
+            summary=summary,
+            summary_truncated=truncated,
+        )
+
+        cls._store_local(record, keywords)
+        cls._share(record)
+        return record
+
+    @staticmethod
+    def _share(record: JobDescriptionRecord) -> None:
+        SharedCache.set(f"job:{record.job_id}", record.model_dump_json())
+        SharedCache.trim("job:", settings.JOB_REGISTRY_MAX_ENTRIES)
+
+    @classmethod
+    def _store_local(cls, record: JobDescriptionRecord, keywords: FrozenSet[str]) -> None:
+        with cls._lock:
+            cls._entries[record.job_id] = (record, keywords)
+            cls._entries.move_to_end(record.job_id)
+            while len(cls._entries) > settings.JOB_REGISTRY_MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def get(cls, job_id: str) -> Optional[JobDescriptionRecord]:
+        entry = cls.get_with_keywords(job_id)
+        return entry[0] if entry else None
+
+    @classmethod
+    def get_with_keywords(cls, job_id: str) -> Optional[Tuple[JobDescriptionRecord, FrozenSet[str]]]:
+        """Return the record and its precomputed keyword set, or None if unknown."""
+        with cls._lock:
+            entry = cls._entries.get(job_id)
+            if entry is not None:
+                cls._entries.move_to_end(job_id)
+                return entry
+
+        # Registered on another worker?
+        cached = SharedCache.get(f"job:{job_id}")
+        if cached is None:
+            return None
+        record = JobDescriptionRecord.model_validate_json(cached)
+        keywords = frozenset(record.keywords)
+        cls._store_local(record, keywords)
+        return record, keywords
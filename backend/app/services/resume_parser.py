@@ -1,32 +1,70 @@
 from ..utils.pdf_extractor import PDFExtractor
 from ..utils.docx_extractor import DOCXExtractor
+from ..utils.fingerprint import TextFingerprint
 from .ats_checker import ATSChecker
-from .ai_analyzer import AIAnalyzer
-from ..models.schemas import ResumeAnalysis, ATSScore, ResumeSection, ImprovementSuggestion
-from typing import Optional
+from .duplicate_index import DuplicateIndex, duplicate_index
+from fastapi.concurrency import run_in_threadpool
+from ..models.schemas import ResumeAnalysis, ATSScore, ResumeSection, ImprovementSuggestion, NearDuplicate
+from ..config import settings
+from typing import FrozenSet, List, Optional, Tuple
+
+_ai_analyzer = None
+
+def get_ai_analyzer():
+    """Shared AIAnalyzer, created on first use (importing it loads the OpenAI SDK)"""
+    global _ai_analyzer
+    if _ai_analyzer is None:
+        from .ai_analyzer import AIAnalyzer
+        _ai_analyzer = AIAnalyzer()
+    return _ai_analyzer
 
 class ResumeParser:
+    # Feedback for deterministic-only analyses (AI skipped under load)
+    DEGRADED_FEEDBACK = (
+        "The service is under high load, so AI review was skipped. "
+        "Scores and formatting checks are complete; submit again later for detailed feedback."
+    )
+    
+    @staticmethod
+    def _extract(file_content: bytes, file_extension: str) -> Tuple[str, List[str]]:
+        """Extract text and formatting issues based on file type"""
+        if file_extension == 'pdf':
+            resume_text = PDFExtractor.extract_text(file_content)
+            formatting_issues = PDFExtractor.check_formatting_issues(file_content)
+        elif file_extension in ['docx', 'doc']:
+            resume_text = DOCXExtractor.extract_text(file_content)
+            formatting_issues = DOCXExtractor.check_formatting_issues(file_content)
+        else:
+            raise ValueError(f"Unsupported file type: {file_extension}")
+        return resume_text, formatting_issues
+    
     @staticmethod
     async def parse_and_analyze(
         file_content: bytes,
         filename: str,
         job_title: Optional[str] = None,
         job_description: Optional[str] = None,
-        target_industry: Optional[str] = None
+        target_industry: Optional[str] = None,
+        job_keywords: Optional[FrozenSet[str]] = None,
+        use_ai: bool = True,
+        owner: Optional[str] = None
     ) -> ResumeAnalysis:
-        """Main function to parse and analyze resume"""
+        """Main function to parse and analyze resume
+        
+        `job_keywords` is the pre-tokenized keyword set of a registered job;
+        when given, the job description is not re-tokenized for scoring.
+        With `use_ai=False` only the deterministic checks run (no OpenAI calls).
+        AI results of the same resume text analyzed for the same job and
+        `owner` (user or tenant) are reused, even with `use_ai=False`.
+        Near-duplicates (SimHash distance) are only flagged.
+        Blocking extraction and OpenAI calls run in the threadpool.
+        """
         
         # Step 1: Extract text based on file type
         file_extension = filename.split('.')[-1].lower()
-        
-        if file_extension == 'pdf':
-            resume_text = PDFExtractor.extract_text(file_content)
-            formatting_issues = PDFExtractor.check_formatting_issues(file_content)
-        elif file_extension in ['docx', 'doc']:
-            resume_text = DOCXExtractor.extract_text(file_content)
-            formatting_issues = DOCXExtractor.check_formatting_issues(file_content)
-        else:
-            raise ValueError(f"Unsupported file type: {file_extension}")
+        resume_text, formatting_issues = await run_in_threadpool(
+            ResumeParser._extract, file_content, file_extension
+        )
         
         if not resume_text.strip():
             raise ValueError("Could not extract text from resume. Please ensure the file is not empty or corrupted.")
@@ -35,20 +73,63 @@ class ResumeParser:
         ats_result = ATSChecker.calculate_ats_score(
             resume_text, 
             formatting_issues,
-            job_description
+            job_description,
+            job_keywords
         )
         
         ats_score = ATSScore(**ats_result)
         
-        # Step 3: AI-powered content analysis
-        ai_analysis = AIAnalyzer.analyze_resume_content(
-            resume_text,
-            job_title,
-            job_description
-        )
+        # Step 3: Fingerprint the text and look for near-duplicate uploads
+        fingerprint = TextFingerprint.simhash(resume_text)
+        text_hash = TextFingerprint.normalized_hash(resume_text)
+        job_key = DuplicateIndex.job_key(job_title, job_description)
+        duplicate = duplicate_index.nearest(fingerprint, settings.DUPLICATE_MAX_DISTANCE)
+        reused = duplicate_index.reusable(fingerprint, text_hash, owner, job_key)
+        
+        # Step 4: AI-powered content, section and keyword analysis
+        # (reused for the same text, owner and job when possible)
+        if reused:
+            ai_result = reused
+        elif use_ai:
+            ai_analyzer = get_ai_analyzer()
+            ai_result = {
+                'analysis': await run_in_threadpool(
+                    ai_analyzer.analyze_resume_content,
+                    resume_text,
+                    job_title,
+                    job_description
+                ),
+                'sections': await run_in_threadpool(ai_analyzer.analyze_sections, resume_text),
+                'keywords': None
+            }
+            if job_title and ats_result['keyword_score'] < 70:
+                ai_result['keywords'] = await run_in_threadpool(
+                    ai_analyzer.get_keyword_suggestions,
+                    resume_text, 
+                    job_title, 
+                    job_description
+                )
+        else:
+            ai_result = None
         
-        # Step 4: Section-by-section analysis
-        sections_data = AIAnalyzer.analyze_sections(resume_text)
+        # Index every upload for near-duplicate flagging; attach AI results
+        # only when they are real model output (never canned fallbacks)
+        if not reused:
+            reusable_result = ai_result
+            if ai_result and get_ai_analyzer().is_fallback(
+                ai_result['analysis'], ai_result['sections'], ai_result['keywords']
+            ):
+                reusable_result = None
+            duplicate_index.add(fingerprint, text_hash, owner, job_key, reusable_result)
+        
+        if ai_result:
+            ai_analysis = ai_result['analysis']
+            sections_data = ai_result['sections']
+            keyword_suggestions = ai_result['keywords']
+        else:
+            ai_analysis = {'overall_feedback': ResumeParser.DEGRADED_FEEDBACK}
+            sections_data = []
+            keyword_suggestions = None
         sections_analysis = [ResumeSection(**section) for section in sections_data]
         
         # Step 5: Compile improvement suggestions
@@ -73,23 +154,17 @@ class ResumeParser:
         missing_sections = ATSChecker.get_missing_sections(resume_text)
         missing_elements = ai_analysis.get('missing_elements', []) + missing_sections
         
-        # Step 7: Get keyword suggestions if job info provided
-        if job_title and ats_result['keyword_score'] < 70:
-            keyword_suggestions = AIAnalyzer.get_keyword_suggestions(
-                resume_text, 
-                job_title, 
-                job_description
-            )
-            if keyword_suggestions:
-                improvement_suggestions.append(
-                    ImprovementSuggestion(
-                        category="Keywords",
-                        priority="High",
-                        issue="Missing important keywords for the target role",
-                        suggestion=f"Consider adding these relevant keywords: {', '.join(keyword_suggestions[:5])}",
-                        example=None
-                    )
+        # Step 7: Add keyword suggestions if job info provided
+        if keyword_suggestions:
+            improvement_suggestions.append(
+                ImprovementSuggestion(
+                    category="Keywords",
+                    priority="High",
+                    issue="Missing important keywords for the target role",
+                    suggestion=f"Consider adding these relevant keywords: {', '.join(keyword_suggestions[:5])}",
+                    example=None
                 )
+            )
         
         # Step 8: Compile final analysis
         analysis = ResumeAnalysis(
@@ -98,7 +173,13 @@ class ResumeParser:
             improvement_suggestions=improvement_suggestions,
             strengths=ai_analysis.get('strengths', []),
             missing_elements=list(set(missing_elements)),  # Remove duplicates
-            overall_feedback=ai_analysis.get('overall_feedback', '')
+            overall_feedback=ai_analysis.get('overall_feedback', ''),
+            fingerprint=TextFingerprint.to_hex(fingerprint),
+            near_duplicate=NearDuplicate(
+                fingerprint=TextFingerprint.to_hex(duplicate[0]["fingerprint"]),
+                distance=duplicate[1],
+                ai_analysis_reused=reused is not None
+            ) if duplicate else None
         )
         
         return analysis
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from ..config import settings
+
+
+class SharedCache:
+    """
+    Small key/value cache shared by all worker processes on a host.
+
+    Notes:
+    - Backed by a local SQLite file in WAL mode, so every worker sees
+      entries written by the others (e.g. a job registered on worker A
+      is usable on worker B).
+    - Best-effort: storage errors are swallowed and behave like a miss.
+    - Bounded: callers trim each key prefix to a maximum number of rows
+      (oldest `updated_at` first), see `trim()`.
+    - One connection per thread; connections are never shared across forks.
+    """
+
+    _local = threading.local()
+    _init_lock = threading.Lock()
+    _initialized_path: Optional[str] = None
+
+    @classmethod
+    def _connect(cls) -> sqlite3.Connection:
+        conn = getattr(cls._local, "conn", None)
+        if conn is not None and getattr(cls._local, "path", None) == settings.SHARED_CACHE_PATH:
+            return conn
+
+        conn = sqlite3.connect(settings.SHARED_CACHE_PATH, timeout=5, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with cls._init_lock:
+            if cls._initialized_path != settings.SHARED_CACHE_PATH:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_updated ON cache (updated_at)")
+                conn.commit()
+                cls._initialized_path = settings.SHARED_CACHE_PATH
+        cls._local.conn = conn
+        cls._local.path = settings.SHARED_CACHE_PATH
+        return conn
+
+    @classmethod
+    def get(cls, key: str) -> Optional[str]:
+        try:
+            row = cls._connect().execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    @classmethod
+    def set(cls, key: str, value: str) -> None:
+        try:
+            conn = cls._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, updated_at) VALUES (?, ?, ?)",
+                    (key, value, time.time()),
+                )
+        except sqlite3.Error:
+            pass
+
+    @classmethod
+    def trim(cls, prefix: str, max_entries: int) -> None:
+        """Keep only the `max_entries` most recently written keys under `prefix`."""
+        try:
+            conn = cls._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM cache WHERE key IN ("
+                    "SELECT key FROM cache WHERE key >= ? AND key < ? "
+                    "ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                    (prefix, prefix + "\uffff", max_entries),
+                )
+        except sqlite3.Error:
+            pass
+
+    @classmethod
+    def reset_connections(cls) -> None:
+        """Drop inherited connections; call in each worker right after fork."""
+        cls._local = threading.local()
+        cls._initialized_path = None
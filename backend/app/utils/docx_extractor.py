@@ -1,4 +1,3 @@
-from docx import Document
 from io import BytesIO
 from typing import List
 
@@ -6,6 +5,7 @@ class DOCXExtractor:
     @staticmethod
     def extract_text(file_content: bytes) -> str:
         """Extract text from DOCX file"""
+        from docx import Document  # Heavy; imported on first use (see utils.runtime.warm_up)
         try:
             doc_file = BytesIO(file_content)
             doc = Document(doc_file)
@@ -29,6 +29,7 @@ class DOCXExtractor:
     @staticmethod
     def check_formatting_issues(file_content: bytes) -> List[str]:
         """Check for ATS-unfriendly formatting in DOCX"""
+        from docx import Document
         issues = []
         try:
             doc_file = BytesIO(file_content)
@@ -1,4 +1,3 @@
-import PyPDF2
 from io import BytesIO
 from typing import List
 
@@ -6,6 +5,7 @@ class PDFExtractor:
     @staticmethod
     def extract_text(file_content: bytes) -> str:
         """Extract text from PDF file"""
+        import PyPDF2  # Heavy; imported on first use (see utils.runtime.warm_up)
         try:
             pdf_file = BytesIO(file_content)
             pdf_reader = PyPDF2.PdfReader(pdf_file)
@@ -21,6 +21,7 @@ class PDFExtractor:
     @staticmethod
     def check_formatting_issues(file_content: bytes) -> List[str]:
         """Check for common ATS-unfriendly formatting"""
+        import PyPDF2
         issues = []
         try:
             pdf_file = BytesIO(file_content)
@@ -0,0 +1,124 @@
+import importlib
+import os
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+# Modules too slow to import on the startup path. They are loaded on first
+# use, by warm_up() after startup, or by the production preloader.
+HEAVY_MODULES = (
+    "PyPDF2",
+    "docx",
+    "openai",
+    "backend.app.services.ai_analyzer",
+)
+
+# Per-process startup measurements, reported by /api/health/runtime
+_process_started = time.perf_counter()
+_ready_after_s: Optional[float] = None
+_preload_ms: Dict[str, float] = {}
+_warm_up_ms: Dict[str, float] = {}
+_warm_up_done = threading.Event()
+
+
+def mark_process_start() -> None:
+    """Reset the cold-start clock (called in each worker right after fork)."""
+    global _process_started, _ready_after_s
+    _process_started = time.perf_counter()
+    _ready_after_s = None
+
+
+def mark_ready() -> float:
+    """Record how long this process took to become ready to serve."""
+    global _ready_after_s
+    _ready_after_s = time.perf_counter() - _process_started
+    return _ready_after_s
+
+
+def record_preload(timings_ms: Dict[str, float]) -> None:
+    _preload_ms.update(timings_ms)
+
+
+def import_timed(names) -> Dict[str, float]:
+    """Import modules in order; return ms spent on each (0 if already loaded)."""
+    timings: Dict[str, float] = {}
+    for name in names:
+        if name in sys.modules:
+            timings[name] = 0.0
+            continue
+        started = time.perf_counter()
+        importlib.import_module(name)
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+    return timings
+
+
+def warm_up() -> None:
+    """Import HEAVY_MODULES so the first request doesn't pay for them."""
+    try:
+        _warm_up_ms.update(import_timed(HEAVY_MODULES))
+    finally:
+        _warm_up_done.set()
+
+
+def start_warm_up() -> None:
+    """Run warm_up() in a background thread, off the startup path."""
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size of this process in MB (None where unavailable, e.g. Windows)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource  # Unix only
+    except ImportError:
+        return None
+    # Non-Linux Unix: fall back to peak RSS (KB on Linux, bytes on macOS)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def memory_mb() -> Dict[str, Optional[float]]:
+    """
+    RSS, PSS and USS of this process in MB
+
+    RSS counts copy-on-write pages shared with the master and other workers
+    in full, so it can't show what preloading saves. PSS splits shared pages
+    between the processes using them, and USS counts only private pages.
+    Both come from /proc/self/smaps_rollup (Linux 4.14+); None elsewhere.
+    """
+    fields: Dict[str, int] = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+    except (OSError, ValueError):
+        pass
+    if "Pss" not in fields:
+        rss = current_rss_mb()
+        return {"rss": round(rss, 1) if rss is not None else None, "pss": None, "uss": None}
+    uss_kb = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    return {
+        "rss": round(fields.get("Rss", 0) / 1024, 1),
+        "pss": round(fields["Pss"] / 1024, 1),
+        "uss": round(uss_kb / 1024, 1),
+    }
+
+
+def report() -> Dict:
+    return {
+        "pid": os.getpid(),
+        "ready_after_ms": round(_ready_after_s * 1000, 1) if _ready_after_s is not None else None,
+        "uptime_s": round(time.perf_counter() - _process_started, 1),
+        "memory_mb": memory_mb(),
+        "preload_ms": dict(_preload_ms),
+        "warm_up_done": _warm_up_done.is_set(),
+        "warm_up_ms": dict(_warm_up_ms),
+    }
@@ -0,0 +1,59 @@
+from typing import Iterable, Optional
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+NDJSON = "application/x-ndjson"
+
+
+def negotiate(accept: Optional[str], offered: Iterable[str]) -> str:
+    """
+    Pick the offered media type the Accept header weights highest, else JSON
+
+    Honors q-values (q=0 excludes a type) and, between equal weights, the
+    client's order. Wildcards (*/*, application/*) only select JSON, so
+    compact formats are used only when asked for by name.
+    """
+    if not accept:
+        return JSON
+    candidates = set(offered) | {JSON}
+    best = None  # (q, -position, media_type)
+    for position, part in enumerate(accept.split(",")):
+        media_type, *params = [piece.strip() for piece in part.split(";")]
+        media_type = media_type.lower()
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type in ("*/*", "application/*"):
+            media_type = JSON
+        if media_type not in candidates or q <= 0:
+            continue
+        if best is None or (q, -position) > best[:2]:
+            best = (q, -position, media_type)
+    return best[2] if best else JSON
+
+
+def model_response(model: BaseModel, accept: Optional[str] = None, status_code: int = 200) -> Response:
+    """
+    Serialize a pydantic model for the response
+
+    Uses pydantic's native JSON encoder (no dict round-trip through the stdlib
+    json module), or MessagePack when the client sends Accept: application/msgpack.
+    """
+    if negotiate(accept, (MSGPACK,)) == MSGPACK:
+        import msgpack  # imported on first use to keep startup light
+        return Response(msgpack.packb(model.model_dump(mode="json")), status_code=status_code, media_type=MSGPACK)
+    return Response(model.model_dump_json(), status_code=status_code, media_type=JSON)
+
+
+def ndjson_response(models: Iterable[BaseModel], headers: Optional[dict] = None) -> Response:
+    """One JSON document per line (newline-delimited JSON)"""
+    body = "".join(model.model_dump_json() + "\n" for model in models)
+    return Response(body, media_type=NDJSON, headers=headers)
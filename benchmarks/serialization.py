@@ -0,0 +1,90 @@
+"""
+Response serialization benchmark.
+
+Builds an analysis response with many suggestions and compares the
+serialization time and payload size of each output format, raw and
+gzip-compressed. orjson is included when installed.
+
+Usage (from the repository root):
+    python benchmarks/serialization.py [--suggestions 5000] [--repeat 20] [--gzip-level 6]
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backend.app.models.schemas import (  # noqa: E402
+    AnalyzeResponse, ATSScore, ImprovementSuggestion, ResumeAnalysis, ResumeSection
+)
+
+
+def build_response(suggestions: int) -> AnalyzeResponse:
+    analysis = ResumeAnalysis(
+        ats_score=ATSScore(overall_score=72, keyword_score=65, formatting_score=80,
+                           content_score=70, details="Good! Minor improvements needed."),
+        sections_analysis=[
+            ResumeSection(section_name=f"Section {i}", content="Summary of the section content",
+                          issues=["Vague bullet points"], suggestions=["Quantify achievements"])
+            for i in range(10)
+        ],
+        improvement_suggestions=[
+            ImprovementSuggestion(category="Impact", priority="High",
+                                  issue=f"Bullet {i} lacks a measurable result",
+                                  suggestion="Add the metric your work moved, e.g. latency or revenue",
+                                  example="Reduced p95 latency by 40% by caching job descriptions")
+            for i in range(suggestions)
+        ],
+        strengths=["Clear structure", "Relevant experience"],
+        missing_elements=["Certifications"],
+        overall_feedback="Solid resume; focus on quantifying impact.",
+        fingerprint="014c599ce63606b8",
+    )
+    return AnalyzeResponse(success=True, filename="resume.pdf", degraded=False, analysis=analysis)
+
+
+def encoders():
+    # Previous path: model_dump() then stdlib json, as in Starlette's JSONResponse
+    yield "stdlib json (model_dump)", lambda m: json.dumps(
+        m.model_dump(), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+    yield "pydantic model_dump_json", lambda m: m.model_dump_json().encode("utf-8")
+    try:
+        import orjson
+        yield "orjson (model_dump)", lambda m: orjson.dumps(m.model_dump())
+    except ImportError:
+        pass
+    import msgpack
+    yield "msgpack (model_dump)", lambda m: msgpack.packb(m.model_dump(mode="json"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suggestions", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--gzip-level", type=int, default=6, help="match GZIP_COMPRESS_LEVEL")
+    args = parser.parse_args()
+
+    response = build_response(args.suggestions)
+    print(f"{args.suggestions} suggestions, best of {args.repeat} runs")
+    print(f"{'format':<28} {'time ms':>9} {'size KB':>9} {'gzip KB':>9} {'gzip ms':>9}")
+    for name, encode in encoders():
+        best = float("inf")
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            payload = encode(response)
+            best = min(best, time.perf_counter() - started)
+        started = time.perf_counter()
+        compressed = gzip.compress(payload, compresslevel=args.gzip_level)
+        gzip_ms = (time.perf_counter() - started) * 1000
+        print(f"{name:<28} {best * 1000:9.2f} {len(payload) / 1024:9.1f} "
+              f"{len(compressed) / 1024:9.1f} {gzip_ms:9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Startup-time benchmark.
+
+Imports the application in fresh interpreters and reports how long
+`import main` takes, plus the slowest modules it pulls in. The budget
+applies to the application's own import time: `import main` minus the
+installed dependencies it loads (FastAPI, pydantic, ...), taken from
+-X importtime. Dependency import time depends on the machine and library
+versions, so counting it would make the check flap. Fails (exit 1) when
+the median own time exceeds IMPORT_BUDGET_MS or when a module listed in
+runtime.HEAVY_MODULES is loaded eagerly at import time.
+
+Usage (from the repository root):
+    python benchmarks/startup.py [--runs 5] [--budget-ms MS]
+"""
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+from functools import lru_cache
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from backend.app.config import settings  # noqa: E402
+from backend.app.utils.runtime import HEAVY_MODULES  # noqa: E402
+
+MEASURE = """
+import json, sys, time
+started = time.perf_counter()
+import main
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({"ms": elapsed, "eager": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def measure_once() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", MEASURE], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def import_tree() -> list:
+    """
+    Parse `python -X importtime -c "import main"` into a tree
+
+    Returns the top-level nodes as (name, cumulative_us, children) tuples.
+    importtime prints children before their parent, indented two spaces
+    per level, so each node adopts the nodes collected one level deeper.
+    """
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stderr
+    pending = {}
+    for line in err.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        node = (name.strip(), int(cumulative), pending.pop(depth + 1, []))
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+@lru_cache(maxsize=None)
+def is_dependency(name: str) -> bool:
+    """True for modules installed in site-packages (not stdlib, not this repo)."""
+    try:
+        spec = importlib.util.find_spec(name.split(".")[0])
+    except (ImportError, ValueError):
+        return False
+    origin = (spec and spec.origin) or ""
+    return "site-packages" in origin or "dist-packages" in origin
+
+
+def own_import_ms(tree: list) -> float:
+    """`import main` minus the dependencies it imports, in ms."""
+    def dependency_us(children: list) -> int:
+        # Outermost dependency nodes only; their subtrees are already included
+        return sum(cum if is_dependency(name) else dependency_us(grand) for name, cum, grand in children)
+
+    main = next(node for node in tree if node[0] == "main")
+    return (main[1] - dependency_us(main[2])) / 1000
+
+
+def slowest_imports(tree: list, limit: int = 10) -> list:
+    """Cumulative import time per top-level package."""
+    totals = {}
+
+    def walk(nodes: list) -> None:
+        for name, cumulative, children in nodes:
+            if "." not in name:
+                totals[name] = max(totals.get(name, 0), cumulative)
+            walk(children)
+
+    walk(tree)
+    return sorted(totals.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=settings.IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    results = [measure_once() for _ in range(args.runs)]
+    timings = [r["ms"] for r in results]
+    median = statistics.median(timings)
+    eager = sorted({m for r in results for m in r["eager"]})
+    trees = [import_tree() for _ in range(args.runs)]
+    own = statistics.median(own_import_ms(tree) for tree in trees)
+
+    print(f"import main: median {median:.0f} ms, min {min(timings):.0f} ms, "
+          f"max {max(timings):.0f} ms over {args.runs} runs")
+    print(f"application's own imports: median {own:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    print("Slowest top-level imports (cumulative):")
+    for name, micros in slowest_imports(trees[-1]):
+        print(f"  {name:<30} {micros / 1000:8.1f} ms")
+
+    failed = False
+    if own > args.budget_ms:
+        print(f"FAIL: own import time over budget by {own - args.budget_ms:.0f} ms")
+        failed = True
+    if eager:
+        print(f"FAIL: heavy modules imported at startup: {', '.join(eager)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,33 @@
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from backend.app.api.routes import router
 from backend.app.config import settings
+from backend.app.services.analysis_store import analysis_store
+from backend.app.utils import runtime
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Cold start and memory per process (each worker logs its own line)
+    ready_after = runtime.mark_ready()
+    memory = runtime.memory_mb()
+    logging.getLogger("uvicorn.error").info(
+        "Worker ready in %.0f ms, memory RSS %s MB, PSS %s MB, USS %s MB",
+        ready_after * 1000, memory["rss"], memory["pss"], memory["uss"]
+    )
+    # Load PDF/DOCX/OpenAI modules in the background instead of at import time
+    runtime.start_warm_up()
+    yield
+    # Write any queued analyses before the process exits
+    analysis_store.close()
 
 app = FastAPI(
     title="Resume Optimizer & ATS Checker",
     description="AI-powered resume analysis and ATS compatibility checker",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -18,6 +39,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (bulk history, analyses with many suggestions)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+)
+
 # Include routes
 app.include_router(router, prefix="/api", tags=["Resume Analysis"])
 
@@ -30,5 +58,16 @@ async def root():
     }
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run("backend.app.main:app", host="0.0.0.0", port=8000, reload=True)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the Resume Optimizer API")
+    parser.add_argument("--production", action="store_true", help="multi-worker server with preloading")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (production only)")
+    args = parser.parse_args()
+
+    if args.production:
+        from backend.app.server import run_production
+        run_production(workers=args.workers)
+    else:
+        import uvicorn
+        uvicorn.run("main:app", host=settings.HOST, port=settings.PORT, reload=True)
@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from backend.app.services.admission import AdaptiveLimiter, AdmissionRejected
+
+
+def make_limiter(**overrides) -> AdaptiveLimiter:
+    options = dict(
+        initial_limit=2,
+        min_limit=1,
+        max_limit=8,
+        tenant_limit=10,
+        target_latency_ms=100,
+        queue_timeout=0.05,
+        max_queue=4,
+        degraded_limit=1,
+    )
+    options.update(overrides)
+    return AdaptiveLimiter(**options)
+
+
+def test_waits_then_rejects_when_global_limit_is_full():
+    limiter = make_limiter()
+
+    async def scenario():
+        await limiter.acquire("a")
+        await limiter.acquire("b")
+        with pytest.raises(AdmissionRejected, match="Timed out"):
+            await limiter.acquire("c")
+
+    asyncio.run(scenario())
+    assert limiter.in_flight == 2
+    assert limiter.waiting == 0
+    assert limiter.rejected == 1
+
+
+def test_rejects_without_waiting_when_queue_is_full():
+    limiter = make_limiter(initial_limit=1, max_queue=0, queue_timeout=10)
+
+    async def scenario():
+        await limiter.acquire("a")
+        with pytest.raises(AdmissionRejected, match="Too many requests waiting"):
+            await asyncio.wait_for(limiter.acquire("b"), 1)
+
+    asyncio.run(scenario())
+    assert limiter.rejected == 1
+
+
+def test_release_admits_a_waiter():
+    limiter = make_limiter(initial_limit=1, queue_timeout=1)
+
+    async def scenario():
+        await limiter.acquire("a")
+        waiter = asyncio.create_task(limiter.acquire("b"))
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+        await limiter.release("a", 10)
+        await asyncio.wait_for(waiter, 1)
+
+    asyncio.run(scenario())
+    assert limiter.in_flight == 1
+    assert limiter.waiting == 0
+
+
+def test_tenant_cap_applies_per_tenant_only():
+    limiter = make_limiter(initial_limit=8, tenant_limit=1)
+
+    async def scenario():
+        await limiter.acquire("a")
+        with pytest.raises(AdmissionRejected):
+            await limiter.acquire("a")
+        await limiter.acquire("b")
+        # Untagged requests are held to the global limit only
+        await limiter.acquire(None)
+        await limiter.acquire(None)
+
+    asyncio.run(scenario())
+    assert limiter.in_flight == 4
+
+
+def test_limit_does_not_grow_under_light_load():
+    limiter = make_limiter(initial_limit=4)
+
+    async def scenario():
+        for _ in range(2000):
+            async with limiter.slot("a"):
+                pass
+
+    asyncio.run(scenario())
+    assert limiter.limit == 4
+
+
+def test_limit_grows_when_saturated_and_fast():
+    limiter = make_limiter(initial_limit=2)
+
+    async def scenario():
+        for _ in range(10):
+            await limiter.acquire("a")
+            await limiter.acquire("b")
+            await limiter.release("a", 10)
+            await limiter.release("b", 10)
+
+    asyncio.run(scenario())
+    assert 2 < limiter.limit <= limiter.max_limit
+
+
+def test_limit_is_capped_at_max():
+    limiter = make_limiter(initial_limit=8, max_limit=8)
+    limiter._observe(10, saturated=True)
+    assert limiter.limit == 8
+
+
+def test_slow_completions_back_off_once_per_latency():
+    limiter = make_limiter(initial_limit=8)
+    limiter._observe(10_000, saturated=True)
+    assert limiter.limit == pytest.approx(8 * AdaptiveLimiter.BACKOFF)
+    # A second slow completion right away belongs to the same burst
+    limiter._observe(10_000, saturated=True)
+    assert limiter.limit == pytest.approx(8 * AdaptiveLimiter.BACKOFF)
+
+
+def test_limit_never_drops_below_min():
+    limiter = make_limiter(initial_limit=1, min_limit=1)
+    limiter._observe(10_000, saturated=True)
+    assert limiter.limit == 1
+
+
+def test_degraded_pool_rejects_when_full():
+    limiter = make_limiter(degraded_limit=1)
+
+    async def scenario():
+        async with limiter.degraded_slot():
+            with pytest.raises(AdmissionRejected, match="Degraded"):
+                async with limiter.degraded_slot():
+                    pass
+        async with limiter.degraded_slot():
+            pass
+
+    asyncio.run(scenario())
+    assert limiter.degraded_in_flight == 0
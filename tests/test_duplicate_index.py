@@ -0,0 +1,51 @@
+from backend.app.services.duplicate_index import DuplicateIndex
+from backend.app.utils.fingerprint import TextFingerprint
+
+RESUME = (
+    "Experience: developed python services for payments and improved latency by 20%. "
+    "Led a team of five engineers building data pipelines in the cloud. "
+    "Education: BSc Computer Science. Skills: Python, SQL, AWS. "
+) * 4
+AI_RESULT = {"analysis": {"overall_feedback": "ok"}, "sections": [], "keywords": None}
+
+
+def index_resume(index, text, owner="u1", job_key="job", ai_result=None):
+    fingerprint = TextFingerprint.simhash(text)
+    index.add(fingerprint, TextFingerprint.normalized_hash(text), owner, job_key, ai_result)
+    return fingerprint
+
+
+def test_uploads_without_ai_result_are_still_flagged():
+    index = DuplicateIndex(max_entries=10)
+    fingerprint = index_resume(index, RESUME)
+    match = index.nearest(fingerprint, 6)
+    assert match is not None and match[1] == 0
+    assert index.reusable(fingerprint, TextFingerprint.normalized_hash(RESUME), "u1", "job") is None
+
+
+def test_reuse_requires_same_text_owner_and_job():
+    index = DuplicateIndex(max_entries=10)
+    fingerprint = index_resume(index, RESUME, ai_result=AI_RESULT)
+    text_hash = TextFingerprint.normalized_hash(RESUME)
+
+    # Same words, different layout and case
+    relaid = RESUME.upper().replace(". ", ".\n")
+    assert TextFingerprint.normalized_hash(relaid) == text_hash
+    assert index.reusable(fingerprint, text_hash, "u1", "job") is AI_RESULT
+
+    assert index.reusable(fingerprint, text_hash, "u2", "job") is None
+    assert index.reusable(fingerprint, text_hash, "u1", "other") is None
+    assert index.reusable(fingerprint, text_hash, None, "job") is None
+
+    edited = RESUME.replace("five", "six")
+    assert index.reusable(
+        TextFingerprint.simhash(edited), TextFingerprint.normalized_hash(edited), "u1", "job"
+    ) is None
+
+
+def test_oldest_entries_are_evicted():
+    index = DuplicateIndex(max_entries=2)
+    first = index_resume(index, "alpha beta gamma delta " * 10)
+    index_resume(index, "one two three four " * 10)
+    index_resume(index, "red green blue yellow " * 10)
+    assert index.nearest(first, 0) is None
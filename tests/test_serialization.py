@@ -0,0 +1,33 @@
+import pytest
+
+from backend.app.utils.serialization import JSON, MSGPACK, NDJSON, negotiate
+
+OFFERED = (NDJSON, MSGPACK)
+
+
+@pytest.mark.parametrize(
+    "accept, expected",
+    [
+        (None, JSON),
+        ("", JSON),
+        ("*/*", JSON),
+        ("text/html", JSON),
+        ("application/msgpack", MSGPACK),
+        ("application/x-ndjson", NDJSON),
+        ("application/json, application/msgpack;q=0", JSON),
+        ("application/msgpack;q=0", JSON),
+        ("application/json;q=0.5, application/msgpack", MSGPACK),
+        ("application/msgpack;q=0.4, application/x-ndjson;q=0.9", NDJSON),
+        ("application/json, application/msgpack", JSON),
+        ("application/msgpack, application/json", MSGPACK),
+        ("application/msgpack;q=0.5, */*", JSON),
+        ("Application/MsgPack; q=1.0", MSGPACK),
+        ("application/msgpack;q=bogus", JSON),
+    ],
+)
+def test_negotiate(accept, expected):
+    assert negotiate(accept, OFFERED) == expected
+
+
+def test_negotiate_ignores_types_not_offered():
+    assert negotiate("application/x-ndjson", (MSGPACK,)) == JSON